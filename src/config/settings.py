@@ -6,7 +6,8 @@ import logging
 import os
 import traceback
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from functools import cached_property
+from typing import List, Dict, Optional, Union
 import pytz
 
 from constants import (
@@ -21,8 +22,10 @@ from constants import (
     DEFAULT_DISCORD_HIDE_MENTION_INSTRUCTIONS,
     DEFAULT_SHOW_TIMEZONE_IN_SUBHEADER,
     DEFAULT_ENABLE_CUSTOM_DISCORD_FOOTER,
-    DEFAULT_ENABLE_CUSTOM_SLACK_FOOTER
+    DEFAULT_ENABLE_CUSTOM_SLACK_FOOTER,
+    PLATFORM_DISCORD, PLATFORM_SLACK, PassedEventHandling
 )
+from utils.format_utils import format_timezone_line
 
 logger = logging.getLogger("config")
 
@@ -220,7 +223,8 @@ class Config:
     
     # Calendar settings
     calendar_urls: List[CalendarUrl] = field(default_factory=list)
-    passed_event_handling: str = DEFAULT_PASSED_EVENT_HANDLING
+    # Given as a string; parsed into the enum in __post_init__ (invalid values stay str)
+    passed_event_handling: Union[PassedEventHandling, str] = PassedEventHandling[DEFAULT_PASSED_EVENT_HANDLING]
     calendar_range: str = DEFAULT_CALENDAR_RANGE
     
     # Time settings
@@ -247,9 +251,14 @@ class Config:
             logger.debug("🏁  Initializing Config object")
             # Normalize string settings
             try:
-                if self.passed_event_handling:
-                    self.passed_event_handling = self.passed_event_handling.upper()
-                    logger.debug(f"🔄  Normalized passed_event_handling to {self.passed_event_handling}")
+                # Parse into the enum once; invalid strings are left for validation to report
+                if isinstance(self.passed_event_handling, str) and self.passed_event_handling:
+                    normalized = self.passed_event_handling.upper()
+                    if normalized in VALID_PASSED_EVENT_HANDLING:
+                        self.passed_event_handling = PassedEventHandling[normalized]
+                    else:
+                        self.passed_event_handling = normalized
+                    logger.debug(f"🔄  Normalized passed_event_handling to {normalized}")
                 
                 if self.calendar_range:
                     self.calendar_range = self.calendar_range.upper()
@@ -288,6 +297,26 @@ class Config:
             logger.debug(f"❌  Exception details: {traceback.format_exc()}")
             return pytz.UTC
     
+    @cached_property
+    def discord_timezone_line(self) -> str:
+        """
+        Get the Discord timezone line, computed once per run
+        
+        Returns:
+            Formatted timezone line, or empty string if unavailable
+        """
+        return format_timezone_line(self.timezone_obj, PLATFORM_DISCORD)
+    
+    @cached_property
+    def slack_timezone_line(self) -> str:
+        """
+        Get the Slack timezone line, computed once per run
+        
+        Returns:
+            Formatted timezone line, or empty string if unavailable
+        """
+        return format_timezone_line(self.timezone_obj, PLATFORM_SLACK)
+    
     @property
     def enabled_platforms(self) -> List[str]:
         """
@@ -345,8 +374,10 @@ class Config:
             
             # Validate the passed event handling option
             try:
-                logger.debug(f"🧪  Validating passed_event_handling: {self.passed_event_handling}")
-                if self.passed_event_handling not in VALID_PASSED_EVENT_HANDLING:
+                handling = self.passed_event_handling
+                handling_name = handling.name if isinstance(handling, PassedEventHandling) else handling
+                logger.debug(f"🧪  Validating passed_event_handling: {handling_name}")
+                if not isinstance(handling, PassedEventHandling):
                     errors.append(f"Invalid PASSED_EVENT_HANDLING value: {self.passed_event_handling}, "
                                 f"must be one of {VALID_PASSED_EVENT_HANDLING}")
             except Exception as e:
@@ -736,14 +767,14 @@ def load_config_from_env() -> Config:
         
         # Validate the passed event handling option
         try:
-            if config.passed_event_handling not in VALID_PASSED_EVENT_HANDLING:
+            if not isinstance(config.passed_event_handling, PassedEventHandling):
                 logger.warning(f"Invalid PASSED_EVENT_HANDLING value: {config.passed_event_handling}, "
                             f"defaulting to {DEFAULT_PASSED_EVENT_HANDLING}")
-                config.passed_event_handling = DEFAULT_PASSED_EVENT_HANDLING
+                config.passed_event_handling = PassedEventHandling[DEFAULT_PASSED_EVENT_HANDLING]
         except Exception as e:
             logger.error(f"Error validating passed event handling: {e}")
             logger.debug(f"❌  Exception details: {traceback.format_exc()}")
-            config.passed_event_handling = DEFAULT_PASSED_EVENT_HANDLING
+            config.passed_event_handling = PassedEventHandling[DEFAULT_PASSED_EVENT_HANDLING]
         
         # Validate configuration
         try:
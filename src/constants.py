@@ -4,11 +4,13 @@
 Application-wide constants
 """
 
+import sys
+from enum import IntEnum
+
 # ==============================================
 # Calendar & Event Parsing
 # ==============================================
 PREMIERE_PATTERN = r'[-\s](?:s\d+e0*1|(?:\d+x0*1))\b'
-EPISODE_PATTERN = r'^(S?\d{1,4}[Ex]\d{1,4})$'
 
 # ==============================================
 # API & HTTP Settings
@@ -17,6 +19,8 @@ MAX_DISCORD_EMBEDS_PER_REQUEST = 10
 DISCORD_SUCCESS_CODES = [200, 204]
 SLACK_SUCCESS_CODES = [200, 201, 204]
 DEFAULT_HTTP_TIMEOUT = 30  # seconds
+HTTP_POOL_CONNECTIONS = 2  # One keep-alive pool per platform host (Discord, Slack)
+HTTP_POOL_MAXSIZE = 4
 DISCORD_EMBED_PAYLOAD_THRESHOLD = 5800
 
 # ==============================================
@@ -38,23 +42,26 @@ MENTION_ROLE_ID_MSG = "If you'd like to be notified when new content is availabl
 NO_CONTENT_TODAY_MSG = "No releases scheduled for this day. Maybe you could call your mom and tell her you love her instead?"
 
 # --- Markdown Styling Constants ---
+# Interned since they are stitched into every formatted event line
 # Discord
-DISCORD_BOLD_START = "**"
-DISCORD_BOLD_END = "**"
-DISCORD_ITALIC_START = "*"
-DISCORD_ITALIC_END = "*"
-DISCORD_STRIKE_START = "~~"
-DISCORD_STRIKE_END = "~~"
+DISCORD_BOLD_START = sys.intern("**")
+DISCORD_BOLD_END = sys.intern("**")
+DISCORD_ITALIC_START = sys.intern("*")
+DISCORD_ITALIC_END = sys.intern("*")
+DISCORD_STRIKE_START = sys.intern("~~")
+DISCORD_STRIKE_END = sys.intern("~~")
+DISCORD_MOVIES_LABEL = sys.intern(f"{DISCORD_BOLD_START}MOVIES{DISCORD_BOLD_END}")
 # Slack
-SLACK_BOLD_START = "*"
-SLACK_BOLD_END = "*"
-SLACK_ITALIC_START = "_"
-SLACK_ITALIC_END = "_"
-SLACK_STRIKE_START = "~"
-SLACK_STRIKE_END = "~"
+SLACK_BOLD_START = sys.intern("*")
+SLACK_BOLD_END = sys.intern("*")
+SLACK_ITALIC_START = sys.intern("_")
+SLACK_ITALIC_END = sys.intern("_")
+SLACK_STRIKE_START = sys.intern("~")
+SLACK_STRIKE_END = sys.intern("~")
+SLACK_MOVIES_LABEL = sys.intern(f"{SLACK_BOLD_START}MOVIES{SLACK_BOLD_END}")
 # Universal (for cases where syntax is the same, like italics with _)
-ITALIC_START = "_"
-ITALIC_END = "_"
+ITALIC_START = sys.intern("_")
+ITALIC_END = sys.intern("_")
 
 COLOR_PALETTE = {
     "discord": {
@@ -126,10 +133,20 @@ DEFAULT_LOG_MAX_SIZE_MB = 1
 DEFAULT_ENABLE_CUSTOM_DISCORD_FOOTER = False
 DEFAULT_ENABLE_CUSTOM_SLACK_FOOTER = False
 
+# ==============================================
+# Config Enums
+# ==============================================
+class PassedEventHandling(IntEnum):
+    """Parsed PASSED_EVENT_HANDLING value, compared as an int in the formatters"""
+    DISPLAY = 0
+    HIDE = 1
+    STRIKE = 2
+
+
 # ==============================================
 # Valid Config Options
 # ==============================================
-VALID_PASSED_EVENT_HANDLING = ["DISPLAY", "HIDE", "STRIKE"]
+VALID_PASSED_EVENT_HANDLING = [m.name for m in PassedEventHandling]
 VALID_CALENDAR_RANGE = ["DAY", "WEEK", "AUTO"]
 
 # ==============================================
@@ -72,6 +72,9 @@ def main():
         logger.error(f"⛔ Error in main function: {e}")
         logger.error(traceback.format_exc())
         return False
+
+    finally:
+        platform_service.close()
     
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 # src/models/platform.py
 
-import re
+import io
+from functools import lru_cache
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -12,30 +13,120 @@ from models.event_item import EventItem
 from config.settings import Config
 from utils.format_utils import (
     format_header_text, format_subheader_text, get_day_colors,
-    format_timezone_line
+    is_standard_episode_number
 )
 from constants import (
     MENTION_ROLE_ID_MSG,
     NO_CONTENT_TODAY_MSG,
     PLATFORM_DISCORD,
     PLATFORM_SLACK,
-    EPISODE_PATTERN,
     # Import styling constants
     DISCORD_BOLD_START, DISCORD_BOLD_END, DISCORD_ITALIC_START, DISCORD_ITALIC_END, DISCORD_STRIKE_START, DISCORD_STRIKE_END,
     SLACK_BOLD_START, SLACK_BOLD_END, SLACK_ITALIC_START, SLACK_ITALIC_END, SLACK_STRIKE_START, SLACK_STRIKE_END,
+    DISCORD_MOVIES_LABEL, SLACK_MOVIES_LABEL,
+    PassedEventHandling,
     ITALIC_START, ITALIC_END # Universal italic
 )
 from services.webhook_service import WebhookService
 
-# Regex to identify common SxxExx or NNNxNNN patterns (case-insensitive)
-# Allows S prefix, 1-4 digits for season, E or x separator, 1-4 digits for episode
-EPISODE_PATTERN = re.compile(EPISODE_PATTERN, re.IGNORECASE)
-
 logger = logging.getLogger("service_platform")
 
+# Episode detail templates keyed by (has_title, is_standard_ep_num)
+_DISCORD_EPISODE_TEMPLATES = {
+    (True, True): f" - {{number}} - {DISCORD_ITALIC_START}{{title}}{DISCORD_ITALIC_END}",
+    (True, False): f" - {DISCORD_ITALIC_START}{{number}} - {{title}}{DISCORD_ITALIC_END}",
+    (False, True): " - {number}",  # Standard number only: Show - SxxExx
+    (False, False): f" - {DISCORD_ITALIC_START}{{number}}{DISCORD_ITALIC_END}",  # Non-standard number only: Show - *Number*
+}
+_SLACK_EPISODE_TEMPLATES = {
+    (True, True): f" - {{number}} - {SLACK_ITALIC_START}{{title}}{SLACK_ITALIC_END}",
+    (True, False): f" - {SLACK_ITALIC_START}{{number}} - {{title}}{SLACK_ITALIC_END}",
+    (False, True): " - {number}",
+    (False, False): f" - {SLACK_ITALIC_START}{{number}}{SLACK_ITALIC_END}",
+}
+
+# Movie line templates indexed by whether the event is struck through
+_DISCORD_MOVIE_TEMPLATES = (
+    f"🎬  {DISCORD_BOLD_START}{{name}}{DISCORD_BOLD_END}",
+    f"{DISCORD_STRIKE_START}🎬  {DISCORD_BOLD_START}{{name}}{DISCORD_BOLD_END}{DISCORD_STRIKE_END}",
+)
+_SLACK_MOVIE_TEMPLATES = (
+    f"🎬  {SLACK_BOLD_START}{{name}}{SLACK_BOLD_END}",
+    f"{SLACK_STRIKE_START}🎬  {SLACK_BOLD_START}{{name}}{SLACK_BOLD_END}{SLACK_STRIKE_END}",
+)
+
+
+# Cached line renderers. Each platform has its own caches, so Discord and Slack
+# never share entries; repeats only hit within a platform (e.g. retries).
+# The bodies run once per unique input, so they skip the local-binding of
+# fields and markers the methods used before caching.
+@lru_cache(maxsize=4096)
+def _format_discord_tv_event(time_str: Optional[str], show_name: str, number: Optional[str],
+                             title: Optional[str], is_premiere: bool, is_past: bool,
+                             passed_event_handling: PassedEventHandling) -> str:
+    """Render a Discord TV line from hashable event fields (cached)"""
+    time_prefix = f"{time_str}: " if time_str else ""
+    formatted_show = f"{DISCORD_BOLD_START}{show_name}{DISCORD_BOLD_END}"
+
+    episode_details = ""
+    if title or number:
+        is_standard_ep_num = bool(number) and is_standard_episode_number(number)
+        template = _DISCORD_EPISODE_TEMPLATES[(bool(title), is_standard_ep_num)]
+        episode_details = template.format(number=number, title=title)
+
+    formatted = f"{time_prefix}{formatted_show}{episode_details}"
+    if is_premiere:
+        formatted += "  🎉"
+    if is_past and passed_event_handling == PassedEventHandling.STRIKE:
+        formatted = f"{DISCORD_STRIKE_START}{formatted}{DISCORD_STRIKE_END}"
+
+    return formatted
+
+
+@lru_cache(maxsize=4096)
+def _format_discord_movie_event(movie_name: str, is_past: bool,
+                                passed_event_handling: PassedEventHandling) -> str:
+    """Render a Discord movie line from hashable event fields (cached)"""
+    strike = is_past and passed_event_handling == PassedEventHandling.STRIKE
+    return _DISCORD_MOVIE_TEMPLATES[strike].format(name=movie_name)
+
+
+@lru_cache(maxsize=4096)
+def _format_slack_tv_event(time_str: Optional[str], show_name: str, number: Optional[str],
+                           title: Optional[str], is_past: bool,
+                           passed_event_handling: PassedEventHandling) -> str:
+    """Render a Slack TV line from hashable event fields (cached)"""
+    time_prefix = f"{time_str}: " if time_str else ""
+    formatted_show = f"{SLACK_BOLD_START}{show_name}{SLACK_BOLD_END}"
+
+    episode_details = ""
+    if title or number:
+        is_standard_ep_num = bool(number) and is_standard_episode_number(number)
+        template = _SLACK_EPISODE_TEMPLATES[(bool(title), is_standard_ep_num)]
+        episode_details = template.format(number=number, title=title)
+
+    formatted = f"{time_prefix}{formatted_show}{episode_details}"
+    if is_past and passed_event_handling == PassedEventHandling.STRIKE:
+        formatted = f"{SLACK_STRIKE_START}{formatted}{SLACK_STRIKE_END}"
+
+    return formatted
+
+
+@lru_cache(maxsize=4096)
+def _format_slack_movie_event(movie_name: str, is_past: bool,
+                              passed_event_handling: PassedEventHandling) -> str:
+    """Render a Slack movie line from hashable event fields (cached)"""
+    strike = is_past and passed_event_handling == PassedEventHandling.STRIKE
+    return _SLACK_MOVIE_TEMPLATES[strike].format(name=movie_name)
+
 
 class Platform(ABC):
     """Abstract base class for messaging platforms"""
+
+    __slots__ = (
+        "webhook_url", "webhook_service", "success_codes", "config",
+        "day_colors", "_get_color", "_default_color", "_movies_label"
+    )
     
     def __init__(self, webhook_url: str, webhook_service: WebhookService, success_codes: List[int], config: Config  ):
         """
@@ -52,6 +143,7 @@ class Platform(ABC):
         self.success_codes = success_codes
         self.config = config
         self.day_colors = self._initialize_day_colors()
+        self._get_color = self.day_colors.get
     
     @abstractmethod
     def _initialize_day_colors(self) -> Dict[str, Any]:
@@ -76,6 +168,39 @@ class Platform(ABC):
         """
         pass
     
+    def _format_day_core(self, day: Day) -> str:
+        """
+        Render a day's TV and movie listings as one block of text
+        
+        Args:
+            day: Day to format
+            
+        Returns:
+            Formatted listings, or an empty string if the day has no events
+        """
+        # Stream tv and movie listings straight into one buffer
+        handling = self.config.passed_event_handling
+        buf = io.StringIO()
+        write = buf.write
+        first = True
+        format_tv_event = self.format_tv_event
+        for event in day.tv_events:
+            if not first:
+                write("\n")
+            write(format_tv_event(event, handling))
+            first = False
+
+        if day.movie_events:
+            if not first:
+                write("\n\n") # Blank line between TV and Movies
+            write(self._movies_label)
+            format_movie_event = self.format_movie_event
+            for event in day.movie_events:
+                write("\n")
+                write(format_movie_event(event, handling))
+
+        return buf.getvalue()
+    
     @abstractmethod
     def format_header(self, custom_header: str, start_date: datetime, 
                      end_date: datetime, show_date_range: bool,
@@ -113,14 +238,30 @@ class Platform(ABC):
             self.success_codes
         )
     
+    def send_messages(self, payloads: List[Dict[str, Any]]) -> bool:
+        """
+        Send several messages to platform in order, reusing one connection
+        
+        Args:
+            payloads: Data to send, in order
+            
+        Returns:
+            Whether every message was sent successfully
+        """
+        return self.webhook_service.send_batch(
+            self.webhook_url,
+            payloads,
+            self.success_codes
+        )
+    
     @abstractmethod
-    def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_tv_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """
         Format a TV event for this platform
         
         Args:
             event_item: EventItem to format
-            passed_event_handling: How to handle passed events (DISPLAY, HIDE, STRIKE)
+            passed_event_handling: How to handle passed events, parsed once on Config
             
         Returns:
             Formatted string for this platform
@@ -128,13 +269,13 @@ class Platform(ABC):
         pass
     
     @abstractmethod
-    def format_movie_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_movie_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """
         Format a movie event for this platform
         
         Args:
             event_item: EventItem to format
-            passed_event_handling: How to handle passed events (DISPLAY, HIDE, STRIKE)
+            passed_event_handling: How to handle passed events, parsed once on Config
             
         Returns:
             Formatted string for this platform
@@ -144,13 +285,35 @@ class Platform(ABC):
 
 class  DiscordPlatform(Platform):
     """Discord implementation of Platform"""
+
+    __slots__ = ("_mention_text",)
     
     def __init__(self, webhook_url: str, webhook_service: WebhookService, 
                  success_codes: List[int], config: Config):
         """Initialize with configuration"""
         super().__init__(webhook_url, webhook_service, success_codes, config)
+        self._default_color = 0
+        self._movies_label = DISCORD_MOVIES_LABEL
+        self._mention_text = self._build_mention_text()
 
+    def _build_mention_text(self) -> str:
+        """
+        Build the role mention block for the header
         
+        Returns:
+            Mention text, or empty string if no role is configured
+        """
+        role_id = self.config.discord_mention_role_id
+        hide_instructions = self.config.discord_hide_mention_instructions
+        logger.debug("Discord mention check: Role ID=%s, Hide=%s", role_id, hide_instructions)
+
+        if not role_id:
+            return ""
+        mention_text = f"<@&{role_id}>"
+        if not hide_instructions:
+            mention_text += f"\n{ITALIC_START}{MENTION_ROLE_ID_MSG}{ITALIC_END}"
+        return mention_text
+
     def _initialize_day_colors(self) -> Dict[str, int]:
         """
         Initialize color scheme for days
@@ -172,27 +335,9 @@ class  DiscordPlatform(Platform):
         """
         try:
             # Get color for this day
-            color = self.day_colors.get(day.day_name, 0)
-
-            # Format TV and movie events
-            tv_formatted = [
-                self.format_tv_event(event, self.config.passed_event_handling)
-                for event in day.tv_events
-            ]
-            movie_formatted = [
-                self.format_movie_event(event, self.config.passed_event_handling)
-                for event in day.movie_events
-            ]
-
-            # Combine tv and movie listings
-            description = ""
-            if tv_formatted:
-                description += "\n".join(tv_formatted)
-                if movie_formatted:
-                    description += "\n\n" # Blank line between TV and Movies
-
-            if movie_formatted:
-                description += f"{DISCORD_BOLD_START}MOVIES{DISCORD_BOLD_END}\n" + "\n".join(movie_formatted)
+            color = self._get_color(day.day_name, self._default_color)
+
+            description = self._format_day_core(day)
 
             # Ensure description is not empty before returning
             if not description:
@@ -231,33 +376,24 @@ class  DiscordPlatform(Platform):
             # --- Get Timezone Line if needed ---
             timezone_line = ""
             if self.config.show_timezone_in_subheader:
-                timezone_line = format_timezone_line(self.config.timezone_obj, PLATFORM_DISCORD)
+                timezone_line = self.config.discord_timezone_line
             logger.debug(f"🖌️  format_header - timezone_line: '{timezone_line}'")
 
-            # --- Create Mention Text ---
-            mention_text = ""
-            role_id = self.config.discord_mention_role_id
-            hide_instructions = self.config.discord_hide_mention_instructions
-            if role_id:
-                mention_text = f"<@&{role_id}>"
-                if not hide_instructions:
-                    mention_text += f"\n{ITALIC_START}{MENTION_ROLE_ID_MSG}{ITALIC_END}"
-            logger.debug(f"🖌️  format_header - mention_text: '{mention_text}'")
+            # --- Mention Text (built once in __init__) ---
+            mention_text = self._mention_text
+            logger.debug("🖌️  format_header - mention_text: '%s'", mention_text)
 
             # --- Combine parts ---
             logger.debug("🖌️  format_header - Attempting to assemble final_content")
             safe_header = str(header_text) if header_text is not None else ""
             safe_subheader = str(subheader).rstrip() if subheader is not None else "" # Use rstrip here
 
-            final_content = f"# {safe_header}\n\n{safe_subheader}"
-            logger.debug("🖌️  format_header - Assembled base final_content")
-
+            parts = [f"# {safe_header}", safe_subheader]
             if timezone_line:
-                final_content += f"\n\n{str(timezone_line)}"
-                logger.debug("🖌️  format_header - Added timezone_line to final_content")
+                parts.append(timezone_line)
             if mention_text:
-                final_content += f"\n\n{str(mention_text)}"
-                logger.debug("🖌️  format_header - Added mention_text to final_content")
+                parts.append(mention_text)
+            final_content = "\n\n".join(parts)
 
             logger.debug("🖌️  format_header - Successfully assembled final_content")
 
@@ -277,66 +413,44 @@ class  DiscordPlatform(Platform):
             "content": final_content
         }
     
-    def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_tv_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """
         Format a TV event
 
         Args:
             event_item: EventItem to format
-            passed_event_handling: How to handle passed events (DISPLAY, HIDE, STRIKE)
-        """
-        time_prefix = f"{event_item.time_str}: " if event_item.time_str else ""
-        show_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
-
-        formatted_show = f"{DISCORD_BOLD_START}{show_name_to_format}{DISCORD_BOLD_END}"
-
-        episode_details = ""
-        number = event_item.episode_number
-        title = event_item.episode_title
-
-        if title:
-            is_standard_ep_num = bool(number and EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number} - {DISCORD_ITALIC_START}{title}{DISCORD_ITALIC_END}"
-            else:
-                episode_details = f" - {DISCORD_ITALIC_START}{number} - {title}{DISCORD_ITALIC_END}"
-        elif number:
-            is_standard_ep_num = bool(EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                # Standard number only: Show - SxxExx
-                episode_details = f" - {number}"
-            else:
-                # Non-standard number only: Show - *Number*
-                episode_details = f" - {DISCORD_ITALIC_START}{number}{DISCORD_ITALIC_END}"
-
-        formatted = f"{time_prefix}{formatted_show}{episode_details}"
-        if event_item.is_premiere:
-            formatted += "  🎉"
-        if event_item.is_past and passed_event_handling == "STRIKE":
-            formatted = f"{DISCORD_STRIKE_START}{formatted}{DISCORD_STRIKE_END}"
-
-        return formatted.strip()
+            passed_event_handling: How to handle passed events, parsed once on Config
+        """
+        return _format_discord_tv_event(
+            event_item.time_str,
+            event_item.show_name or event_item.summary,
+            event_item.episode_number,
+            event_item.episode_title,
+            event_item.is_premiere,
+            event_item.is_past,
+            passed_event_handling
+        )
     
-    def format_movie_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_movie_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """Format a movie event for Discord"""
-        movie_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
-
-        formatted = f"🎬  {DISCORD_BOLD_START}{movie_name_to_format}{DISCORD_BOLD_END}"
-
-        if event_item.is_past and passed_event_handling == "STRIKE":
-            formatted = f"{DISCORD_STRIKE_START}{formatted}{DISCORD_STRIKE_END}"
-
-        return formatted.strip()
+        return _format_discord_movie_event(
+            event_item.show_name or event_item.summary,
+            event_item.is_past,
+            passed_event_handling
+        )
 
 
 class SlackPlatform(Platform):
     """Slack implementation of Platform"""
+
+    __slots__ = ()
     
     def __init__(self, webhook_url: str, webhook_service: WebhookService, 
                  success_codes: List[int], config: Config):
         """Initialize with configuration"""
         super().__init__(webhook_url, webhook_service, success_codes, config)
-        # self.config = config
+        self._default_color = "#000000"
+        self._movies_label = SLACK_MOVIES_LABEL
     
     def _initialize_day_colors(self) -> Dict[str, str]:
         """
@@ -358,30 +472,9 @@ class SlackPlatform(Platform):
             Slack attachment object
         """
         # Get color for this day
-        color = self.day_colors.get(day.day_name, "#000000")
-        
-        # Format TV and movie events
-        tv_formatted = [
-            self.format_tv_event(event, self.config.passed_event_handling) 
-            for event in day.tv_events
-        ]
+        color = self._get_color(day.day_name, self._default_color)
         
-        movie_formatted = [
-            self.format_movie_event(event, self.config.passed_event_handling) 
-            for event in day.movie_events
-        ]
-        
-        # Combine tv and movie listings
-        text = ""
-        if tv_formatted:
-            text += "\n".join(tv_formatted)
-            # Add blank line only if both TV and Movies exist
-            if movie_formatted:
-                text += "\n\n"
-
-        if movie_formatted:
-            # Use Slack bold constants for the header
-            text += f"{SLACK_BOLD_START}MOVIES{SLACK_BOLD_END}\n" + "\n".join(movie_formatted)
+        text = self._format_day_core(day)
 
         # Ensure text is not empty before returning
         if not text:
@@ -421,20 +514,10 @@ class SlackPlatform(Platform):
         # Get timezone line if needed
         timezone_line = ""
         if self.config.show_timezone_in_subheader:
-            timezone_line = format_timezone_line(self.config.timezone_obj, PLATFORM_SLACK)
-
-        # Combine subheader and timezone for the section block's text
-        section_block_text = ""
-        if subheader_text and timezone_line:
-            # Both exist, add newline between them
-            section_block_text = f"{subheader_text}\n\n{timezone_line}"
-        elif subheader_text:
-            # Only subheader exists
-            section_block_text = subheader_text
-        elif timezone_line:
-            # Only timezone exists (not super likely, but handle)
-            section_block_text = timezone_line
-        # If both are empty, section_block_text remains ""
+            timezone_line = self.config.slack_timezone_line
+
+        # Combine subheader and timezone for the section block's text, skipping empty parts
+        section_block_text = "\n\n".join(part for part in (subheader_text, timezone_line) if part)
 
         # --- Assemble Blocks ---
         blocks = []
@@ -462,45 +545,23 @@ class SlackPlatform(Platform):
             "blocks": blocks
         }
 
-    def format_tv_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_tv_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """
         Format a TV event for Slack, applying italics based on content.
         """
-        time_prefix = f"{event_item.time_str}: " if event_item.time_str else ""
-        show_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
-        formatted_show = f"{SLACK_BOLD_START}{show_name_to_format}{SLACK_BOLD_END}"
-
-        episode_details = ""
-        number = event_item.episode_number
-        title = event_item.episode_title
-
-        if title:
-            is_standard_ep_num = bool(number and EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number} - {SLACK_ITALIC_START}{title}{SLACK_ITALIC_END}"
-            else:
-                episode_details = f" - {SLACK_ITALIC_START}{number} - {title}{SLACK_ITALIC_END}"
-        elif number:
-            is_standard_ep_num = bool(EPISODE_PATTERN.match(number))
-            if is_standard_ep_num:
-                episode_details = f" - {number}"
-            else:
-                episode_details = f" - {SLACK_ITALIC_START}{number}{SLACK_ITALIC_END}"
-
-        formatted = f"{time_prefix}{formatted_show}{episode_details}"
-        if event_item.is_premiere:
-            formatted += "  "
-        if event_item.is_past and passed_event_handling == "STRIKE":
-            formatted = f"{SLACK_STRIKE_START}{formatted}{SLACK_STRIKE_END}"
-
-        return formatted.strip()
+        return _format_slack_tv_event(
+            event_item.time_str,
+            event_item.show_name or event_item.summary,
+            event_item.episode_number,
+            event_item.episode_title,
+            event_item.is_past,
+            passed_event_handling
+        )
     
-    def format_movie_event(self, event_item: EventItem, passed_event_handling: str) -> str:
+    def format_movie_event(self, event_item: EventItem, passed_event_handling: PassedEventHandling) -> str:
         """Format a movie event for Slack"""
-        movie_name_to_format = event_item.show_name if event_item.show_name else event_item.summary
-        formatted = f"🎬  {SLACK_BOLD_START}{movie_name_to_format}{SLACK_BOLD_END}"
-
-        if event_item.is_past and passed_event_handling == "STRIKE":
-            formatted = f"{SLACK_STRIKE_START}{formatted}{SLACK_STRIKE_END}"
-
-        return formatted.strip()
\ No newline at end of file
+        return _format_slack_movie_event(
+            event_item.show_name or event_item.summary,
+            event_item.is_past,
+            passed_event_handling
+        )
\ No newline at end of file
@@ -12,7 +12,7 @@ from models.event import Event
 from models.event_item import EventItem
 from config.settings import Config
 from utils.date_utils import get_days_order, get_short_day_name, parse_event_datetime, format_time
-from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE
+from constants import EVENT_TYPE_TV, EVENT_TYPE_MOVIE, PassedEventHandling
 
 logger = logging.getLogger("formatter_service")
 
@@ -64,7 +64,7 @@ class FormatterService:
         
         for event in events:
             # Skip past events if configured to hide them
-            if event.is_past and self.config.passed_event_handling == "HIDE":
+            if event.is_past and self.config.passed_event_handling == PassedEventHandling.HIDE:
                 logger.debug(f"⏪  Skipping past event: {event.summary}")
                 skipped_past_count += 1
                 continue
@@ -199,6 +199,9 @@ class FormatterService:
                     episode_number, episode_title = sub_parts
                 else:
                     episode_number = episode_info
+
+        # Stripped once here so formatters never need to strip per render
+        show_name = show_name.strip()
         
         # Create the EventItem
         return EventItem(
@@ -64,6 +64,13 @@ class PlatformService:
             
         return platforms
     
+    def close(self) -> None:
+        """
+        Release the webhook session opened for this run
+        """
+        self.webhook_service.close()
+        logger.debug("🔒  PlatformService closed")
+    
     def send_to_platforms(self, days: List[Day], events_summary: Dict[str, int],
                           start_date: datetime, end_date: datetime) -> Dict[str, bool]:
         """
@@ -166,6 +173,7 @@ class PlatformService:
                 current_payload_size += header_content_size # Tentatively add header size
 
                 footer_sent_in_batch = False # Flag to track if footer gets included
+                pending_payloads = [] # Sent together once batching is done
 
                 for i, embed in enumerate(all_embeds):
                     embed_str = json.dumps(embed)
@@ -182,11 +190,9 @@ class PlatformService:
                              payload_to_send["content"] = initial_header_content
                              initial_header_content = "" # Clear header after adding it once
 
-                        # Send the current batch
-                        logger.debug(f"Sending Discord batch: {len(current_batch)} embeds, size ~{current_payload_size}")
-                        if not platform.send_message(payload_to_send):
-                            overall_success = False
-                            logger.error("Failed to send a Discord batch.")
+                        # Queue the current batch
+                        logger.debug(f"Queueing Discord batch: {len(current_batch)} embeds, size ~{current_payload_size}")
+                        pending_payloads.append(payload_to_send)
 
                         # Start a new batch
                         current_batch = [embed]
@@ -208,21 +214,24 @@ class PlatformService:
                     # Prepare payload with ONLY embeds
                     final_payload = {"embeds": current_batch}
 
-                    # Send the final batch (embeds only)
+                    # Queue the final batch (embeds only)
                     final_payload_size = len(json.dumps(final_payload))
-                    logger.debug(f"Sending final Discord batch: {len(current_batch)} embeds, size ~{final_payload_size}")
-                    if not platform.send_message(final_payload):
-                        overall_success = False
-                        logger.error("Failed to send the final Discord batch.")
+                    logger.debug(f"Queueing final Discord batch: {len(current_batch)} embeds, size ~{final_payload_size}")
+                    pending_payloads.append(final_payload)
 
-                # --- Send Discord Footer Separately (ALWAYS if content exists) ---
+                # --- Queue Discord Footer Separately (ALWAYS if content exists) ---
                 if discord_footer_content:
-                    logger.info("🚚  Sending custom Discord footer as separate message...")
-                    if not platform.send_message({"content": discord_footer_content}):
-                        overall_success = False
-                        logger.error("Failed to send Discord footer message.")
+                    logger.info("🚚  Queueing custom Discord footer as separate message...")
+                    pending_payloads.append({"content": discord_footer_content})
                 # --- End Discord Footer ---
 
+                # --- Send all queued Discord messages over one connection ---
+                if pending_payloads:
+                    logger.debug(f"Sending {len(pending_payloads)} queued Discord messages")
+                    if not platform.send_messages(pending_payloads):
+                        overall_success = False
+                        logger.error("Discord batch send reported failures; see webhook_service log for per-payload detail.")
+
             elif isinstance(platform, SlackPlatform):
                 # --- Format Days (Attachments) ---
                 logger.info(f"Formatting {len(days)} days for Slack...")
@@ -3,8 +3,11 @@
 
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any
 
+from constants import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
 logger = logging.getLogger("webhook_service")
 
 
@@ -19,6 +22,13 @@ class WebhookService:
             http_timeout: HTTP request timeout in seconds
         """
         self.http_timeout = http_timeout
+
+        # Reuse one session so consecutive webhook posts share keep-alive connections
+        self.session = requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
     
     def send_request(self, webhook_url: str, payload: Dict[str, Any], 
                    success_codes: List[int]) -> bool:
@@ -33,13 +43,10 @@ class WebhookService:
         Returns:
             Boolean indicating success
         """
-        headers = {'Content-Type': 'application/json'}
-        
         try:
-            response = requests.post(
+            response = self.session.post(
                 webhook_url, 
                 json=payload, 
-                headers=headers, 
                 timeout=self.http_timeout
             )
             logger.debug(f"Webhook URL: {webhook_url}")
@@ -56,4 +63,33 @@ class WebhookService:
                 
         except requests.RequestException as e:
             logger.error(f"Error sending to webhook: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    def send_batch(self, webhook_url: str, payloads: List[Dict[str, Any]],
+                   success_codes: List[int]) -> bool:
+        """
+        Send several payloads to a webhook in order over the shared session
+        
+        Payloads are sent sequentially so messages arrive in the order given.
+        A failed payload does not stop the remaining ones from being sent.
+        
+        Args:
+            webhook_url: URL to send data to
+            payloads: Data to send, in order
+            success_codes: HTTP status codes that indicate success
+            
+        Returns:
+            Boolean indicating every payload was sent successfully
+        """
+        all_sent = True
+        for i, payload in enumerate(payloads, start=1):
+            if not self.send_request(webhook_url, payload, success_codes):
+                logger.error(f"❌  Failed to send payload {i} of {len(payloads)} in batch")
+                all_sent = False
+        return all_sent
+
+    def close(self) -> None:
+        """
+        Close the shared session and release its pooled connections
+        """
+        self.session.close()
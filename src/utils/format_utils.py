@@ -35,6 +35,33 @@ def pluralize(word: str, count: int, plural: str = None) -> str:
     return word if count == 1 else plural
 
 
+def is_standard_episode_number(number: str) -> bool:
+    """
+    Check for a common SxxExx or NNNxNNN episode number (case-insensitive)
+
+    Accepts an optional S prefix, 1-4 digits for season, an E or x
+    separator and 1-4 digits for episode. Hand-rolled instead of a regex
+    since it runs for every TV event and the strings are tiny.
+
+    Args:
+        number: Episode number string, e.g. "S01E05" or "3x12"
+
+    Returns:
+        Boolean indicating if the number follows a standard format
+    """
+    start = 1 if number[:1] in ("S", "s") else 0
+    for sep in range(start, len(number)):
+        if number[sep] in "EeXx":
+            break
+    else:
+        return False
+
+    season = number[start:sep]
+    episode = number[sep + 1:]
+    return (0 < len(season) <= 4 and 0 < len(episode) <= 4
+            and season.isdecimal() and episode.isdecimal())
+
+
 
 
 